@@ -1,5 +1,5 @@
-from typing import Any, List, Tuple, Dict, Annotated
-from pydantic import BaseModel, field_validator, ValidationInfo, Field
+from typing import Any, FrozenSet, List, Optional, Set, Dict, Union, Annotated
+from pydantic import BaseModel, PrivateAttr, TypeAdapter, field_validator, model_validator, Field
 from .utils import exceptions, constants as const
 from .model.m_test_config import TestConfigModel
 from .model.m_test_type_config import TestTypesConfiguration
@@ -8,6 +8,21 @@ from .model.m_protocol_segment import ProtocolSegmentProfileConfig
 
 
 PortConfType = List[PortConfiguration]
+# built once at import and reused by PluginModel2544.validate_ports
+PORTS_ADAPTER = TypeAdapter(PortConfType)
+
+# enum members are singletons, per-port checks compare them by identity
+_EAST = const.PortGroup.EAST
+_WEST = const.PortGroup.WEST
+_UNDEFINED = const.PortGroup.UNDEFINED
+_E2W = const.TrafficDirection.EAST_TO_WEST
+_W2E = const.TrafficDirection.WEST_TO_EAST
+
+
+def index_profiles(
+    protocol_segments: List[ProtocolSegmentProfileConfig],
+) -> Dict[str, ProtocolSegmentProfileConfig]:
+    return {profile.id: profile for profile in protocol_segments}
 
 
 class PluginModel2544(BaseModel):  # Main Model
@@ -15,166 +30,161 @@ class PluginModel2544(BaseModel):  # Main Model
     protocol_segments: List[ProtocolSegmentProfileConfig]
     ports_configuration: Annotated[PortConfType, Field(validate_default=True)]
     test_types_configuration: TestTypesConfiguration
+    _ports_by_group: Dict[const.PortGroup, PortConfType] = PrivateAttr(default_factory=dict)
 
     def set_ports_rx_tx_type(self) -> None:
         direction = self.test_configuration.topology_config.direction
-        for port_config in self.ports_configuration:
-            if port_config.is_loop:
+        # (direction, port group) -> role the port loses; bidirectional keeps both
+        actions = {
+            (_E2W, _EAST): PortConfiguration.set_rx_port,
+            (_E2W, _WEST): PortConfiguration.set_tx_port,
+            (_W2E, _EAST): PortConfiguration.set_tx_port,
+            (_W2E, _WEST): PortConfiguration.set_rx_port,
+        }
+        for port_group in (_EAST, _WEST):
+            action = actions.get((direction, port_group))
+            if not action:
                 continue
-            elif direction == const.TrafficDirection.EAST_TO_WEST:
-                if port_config.port_group.is_east:
-                    port_config.set_rx_port(False)
-                elif port_config.port_group.is_west:
-                    port_config.set_tx_port(False)
-            elif direction == const.TrafficDirection.WEST_TO_EAST:
-                if port_config.port_group.is_east:
-                    port_config.set_tx_port(False)
-                elif port_config.port_group.is_west:
-                    port_config.set_rx_port(False)
+            for port_config in self._ports_by_group[port_group]:
+                if not port_config.is_loop:
+                    action(port_config, False)
 
     def set_profile(self) -> None:
+        profiles_by_id = index_profiles(self.protocol_segments)
         for port_config in self.ports_configuration:
-            profile_id = port_config.protocol_segment_profile_id
-            profile = [i for i in self.protocol_segments if i.id == profile_id][0]
-            port_config.set_profile(profile.copy(deep=True))
+            profile = profiles_by_id.get(port_config.protocol_segment_profile_id)
+            if profile is None:
+                raise exceptions.PSPMissing()
+            # ports only read their profile; StreamStruct.set_packet_header
+            # deep-copies it before writing addresses into the segments
+            port_config.set_profile(profile)
 
     def __init__(self, **data: Dict[str, Any]) -> None:
         super().__init__(**data)
         self.set_ports_rx_tx_type()
 
-        self.check_port_groups_and_peers()
+        self.check_port_peers()
         self.set_profile()
 
-    
-    @field_validator("ports_configuration")
-    def check_ip_properties(cls, value: "PortConfType", info: ValidationInfo) -> "PortConfType":
-        pro_map = {v.id: v.protocol_version for v in info.data['protocol_segments']}
-        for i, port_config in enumerate(value):
-            if port_config.protocol_segment_profile_id not in pro_map:
-                raise exceptions.PSPMissing()
-            if (
-                pro_map[port_config.protocol_segment_profile_id].is_l3
-                and (not port_config.ip_address or port_config.ip_address.address.is_empty)
-            ):
-                raise exceptions.IPAddressMissing()
-        return value
-
-    
-    @field_validator("ports_configuration")
-    def check_port_count(cls, value: "PortConfType", info: ValidationInfo) -> "PortConfType":
-        require_ports = 2
-        if "test_configuration" in info.data:
-            topology: const.TestTopology = info.data[
-                "test_configuration"
-            ].topology_config.topology
-            if topology.is_pair_topology:
-                require_ports = 1
-            if len(value) < require_ports:
-                raise exceptions.PortConfigNotEnough(require_ports)
-        return value
-
-    def check_port_groups_and_peers(self) -> None:
+    @classmethod
+    def validate_ports(cls, raw_list: List[Dict[str, Any]]) -> PortConfType:
+        """validate a ports configuration list on its own, reusing PORTS_ADAPTER"""
+        return PORTS_ADAPTER.validate_python(raw_list)
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> "PluginModel2544":
+        """validate a raw JSON config without building an intermediate dict"""
+        return cls.model_validate_json(raw)
+
+    @model_validator(mode="after")
+    def check_ports_configuration(self) -> "PluginModel2544":
+        # cheapest checks first so invalid configs fail before the per-port
+        # profile and IP scans: port count, port groups, profile ids, L3 setup.
+        # (check_test_type_enable has already run as a field validator.)
         topology = self.test_configuration.topology_config.topology
-        ports_in_east = ports_in_west = 0
         uses_port_peer = topology.is_pair_topology
+        require_ports = 1 if uses_port_peer else 2
+        if len(self.ports_configuration) < require_ports:
+            raise exceptions.PortConfigNotEnough(require_ports)
+
+        ports_by_group: Dict[const.PortGroup, PortConfType] = {
+            _EAST: [], _WEST: [], _UNDEFINED: []
+        }
         for port_config in self.ports_configuration:
-            if not topology.is_mesh_topology:
-                ports_in_east, ports_in_west = self.count_port_group(
-                    port_config, uses_port_peer, ports_in_east, ports_in_west
-                )
-            if uses_port_peer:
-                self.check_port_peer(port_config, self.ports_configuration)
+            ports_by_group[port_config.port_group].append(port_config)
         if not topology.is_mesh_topology:
-            for i, group in (ports_in_east, "East"), (ports_in_west, "West"):
-                if not i:
-                    raise exceptions.PortGroupError(group)
-
-
-    @field_validator("ports_configuration")
-    def check_modifier_mode_and_segments(cls, value: PortConfType, info: ValidationInfo) -> PortConfType:
-        if "test_configuration" in info.data:
-            flow_creation_type = info.data[
-                "test_configuration"
-            ].test_execution_config.flow_creation_config.flow_creation_type
-            for port_config in value:
-                if (
-                    not flow_creation_type.is_stream_based
-                ) and port_config.profile.protocol_version.is_l3:
-                    raise exceptions.ModifierBasedNotSupportL3()
-        return value
-
-
-    @field_validator("ports_configuration")
-    def check_port_group(cls, value: PortConfiguration, info: ValidationInfo) -> PortConfiguration:
-        if "ports_configuration" in info.data and "test_configuration" in info.data:
-            for k, p in info.data["ports_configuration"].items():
-                if (
-                    p.port_group == const.PortGroup.UNDEFINED
-                    and not info.data[
-                        "test_configuration"
-                    ].topology_config.topology.is_mesh_topology
-                ):
-                    raise exceptions.PortGroupNeeded()
-        return value
+            if ports_by_group[_UNDEFINED]:
+                raise exceptions.PortGroupNeeded()
+            self.check_port_groups(ports_by_group, uses_port_peer)
+        self._ports_by_group = ports_by_group
+
+        pro_map = index_profiles(self.protocol_segments)
+        if any(
+            port_config.protocol_segment_profile_id not in pro_map
+            for port_config in self.ports_configuration
+        ):
+            raise exceptions.PSPMissing()
+
+        flow_creation_type = (
+            self.test_configuration.test_execution_config.flow_creation_config.flow_creation_type
+        )
+        is_stream_based = flow_creation_type.is_stream_based
+        for port_config in self.ports_configuration:
+            if not pro_map[port_config.protocol_segment_profile_id].protocol_version.is_l3:
+                continue
+            if not port_config.ip_address or port_config.ip_address.address.is_empty:
+                raise exceptions.IPAddressMissing()
+            if not is_stream_based:
+                raise exceptions.ModifierBasedNotSupportL3()
+        return self
+
+    @staticmethod
+    def check_port_groups(
+        ports_by_group: Dict[const.PortGroup, PortConfType],
+        uses_port_peer: bool,
+    ) -> None:
+        east_ports = ports_by_group[_EAST]
+        west_ports = ports_by_group[_WEST]
+        ports_in_east = len(east_ports)
+        ports_in_west = len(west_ports)
+        if uses_port_peer:
+            # a looped port in pair topology serves both groups
+            ports_in_east += sum(1 for p in west_ports if p.is_loop)
+            ports_in_west += sum(1 for p in east_ports if p.is_loop)
+        for i, group in (ports_in_east, "East"), (ports_in_west, "West"):
+            if not i:
+                raise exceptions.PortGroupError(group)
+
+    def check_port_peers(self) -> None:
+        if not self.test_configuration.topology_config.topology.is_pair_topology:
+            return
+        check_port_peer = self.check_port_peer
+        ports_by_slot = {p.port_slot: p for p in self.ports_configuration}
+        checked_pairs: Set[FrozenSet[Optional[int]]] = set()
+        for port_config in self.ports_configuration:
+            # a consistent pair is validated in both directions at once
+            pair = frozenset((port_config.port_slot, port_config.peer_slot))
+            if pair not in checked_pairs:
+                check_port_peer(port_config, ports_by_slot)
+                checked_pairs.add(pair)
 
     @field_validator("test_types_configuration")
     def check_test_type_enable(
         cls, v: "TestTypesConfiguration"
     ) -> "TestTypesConfiguration":
         if not any(
-            {
-                v.throughput_test.enabled,
-                v.latency_test.enabled,
-                v.frame_loss_rate_test.enabled,
-                v.back_to_back_test.enabled,
-            }
+            test_type.enabled
+            for test_type in (
+                v.throughput_test,
+                v.latency_test,
+                v.frame_loss_rate_test,
+                v.back_to_back_test,
+            )
         ):
             raise exceptions.TestTypesError()
         return v
 
 
-    @field_validator("test_types_configuration")
-    def check_result_scope(cls, value: "TestTypesConfiguration", info: ValidationInfo) -> "TestTypesConfiguration":
-        if "test_configuration" not in info.data:
-            return value
+    @model_validator(mode="after")
+    def check_result_scope(self) -> "PluginModel2544":
+        throughput_test = self.test_types_configuration.throughput_test
         if (
-            value.throughput_test.enabled
-            and value.throughput_test.rate_iteration_options.result_scope
+            throughput_test.enabled
+            and throughput_test.rate_iteration_options.result_scope
             == const.RateResultScopeType.PER_SOURCE_PORT
-            and not info.data[
-                "test_configuration"
-            ].test_execution_config.flow_creation_config.flow_creation_type.is_stream_based
+            and not self.test_configuration.test_execution_config.flow_creation_config.flow_creation_type.is_stream_based
         ):
             raise exceptions.ModifierBasedNotSupportPerPortResult()
-        return value
-
-    @staticmethod
-    def count_port_group(
-        port_config: "PortConfiguration",
-        uses_port_peer: bool,
-        ports_in_east: int,
-        ports_in_west: int,
-    ) -> Tuple[int, int]:
-        if port_config.port_group.is_east:
-            ports_in_east += 1
-            if uses_port_peer and port_config.is_loop:
-                ports_in_west += 1
-
-        elif port_config.port_group.is_west:
-            ports_in_west += 1
-            if uses_port_peer and port_config.is_loop:
-                ports_in_east += 1
-
-        return ports_in_east, ports_in_west
+        return self
 
     @staticmethod
     def check_port_peer(
         port_config: "PortConfiguration",
-        ports_configuration: List["PortConfiguration"],
+        ports_by_slot: Dict[int, "PortConfiguration"],
     ) -> None:
         peer_slot = port_config.peer_slot
-        if peer_slot is None or peer_slot >= len(ports_configuration):
+        peer_config = ports_by_slot.get(peer_slot) if peer_slot is not None else None
+        if peer_config is None:
             raise exceptions.PortPeerNeeded()
-        peer_config = ports_configuration[peer_slot]
         if not port_config.is_pair(peer_config) or not peer_config.is_pair(port_config):
             raise exceptions.PortPeerInconsistent()
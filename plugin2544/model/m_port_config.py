@@ -1,53 +1,67 @@
-from ipaddress import (
-    IPv4Network,
-    IPv6Network,
-    ip_network,
-    ip_address,
-    IPv4Address as OriginIPv4Address,
-    IPv6Address as OriginIPv6Address,
-)
-from typing import Union, Optional
-from pydantic import BaseModel, field_validator, Field
+from ipaddress import IPv4Network, IPv6Network
+from typing import Any, Dict, Union, Optional
+from pydantic import BaseModel, PrivateAttr, field_validator, model_validator, Field
 from ..utils import constants as const
 from ..utils.field import MacAddress, IPv4Address, IPv6Address, Prefix
 from .m_protocol_segment import ProtocolSegmentProfileConfig
 
 
+# bit flags of PortConfiguration._txrx
+TX_ROLE = 0b01
+RX_ROLE = 0b10
+
+# shared immutable values for the common address/prefix inputs
+IPV4_ZERO = IPv4Address("0.0.0.0")
+IPV6_ZERO = IPv6Address("::")
+PREFIXES = tuple(Prefix(i) for i in range(129))
+
+
 class IPAddressProperties(BaseModel, arbitrary_types_allowed=True):
     # These will be converted to IPv4Address/IPv6Address by validators
-    address: Union[IPv4Address, IPv6Address] = IPv4Address("0.0.0.0")
-    routing_prefix: Prefix = Prefix(24)
-    public_address: Union[IPv4Address, IPv6Address] = IPv4Address("0.0.0.0")
-    public_routing_prefix: Prefix = Prefix(24)
-    gateway: Union[IPv4Address, IPv6Address] = IPv4Address("0.0.0.0")
-    remote_loop_address: Union[IPv4Address, IPv6Address] = IPv4Address("0.0.0.0")
+    address: Union[IPv4Address, IPv6Address] = IPV4_ZERO
+    routing_prefix: Prefix = PREFIXES[24]
+    public_address: Union[IPv4Address, IPv6Address] = IPV4_ZERO
+    public_routing_prefix: Prefix = PREFIXES[24]
+    gateway: Union[IPv4Address, IPv6Address] = IPV4_ZERO
+    remote_loop_address: Union[IPv4Address, IPv6Address] = IPV4_ZERO
+
+    _network: Union[IPv4Network, IPv6Network] = PrivateAttr()
+    _dst_addr: Union[IPv4Address, IPv6Address] = PrivateAttr()
 
     @field_validator("address", "public_address", "gateway", "remote_loop_address", mode="before")
     def set_address(
         cls, value: Union[str, "IPv4Address", "IPv6Address"]
     ) -> Union["IPv4Address", "IPv6Address"]:
         if isinstance(value, str):
-            address = ip_address(value)
-            return (
-                IPv4Address(address)
-                if isinstance(address, OriginIPv4Address)
-                else IPv6Address(address)
-            )
+            if value == "0.0.0.0":
+                return IPV4_ZERO
+            if value == "::":
+                return IPV6_ZERO
+            # only IPv6 notation contains a colon, so parse straight into the right class
+            return IPv6Address(value) if ":" in value else IPv4Address(value)
         return value
-    
+
+    @model_validator(mode="after")
+    def set_derived_addresses(self) -> "IPAddressProperties":
+        self._network = self.address.network(self.routing_prefix)
+        self._dst_addr = self.public_address if not self.public_address.is_empty else self.address
+        return self
+
     @property
     def network(self) -> Union["IPv4Network", "IPv6Network"]:
-        return ip_network(f"{self.address}/{self.routing_prefix}", strict=False)
-    
+        return self._network
+
     @field_validator("routing_prefix", "public_routing_prefix", mode="before")
     def set_prefix(cls, value: int) -> Prefix:
+        if isinstance(value, int) and 0 <= value < len(PREFIXES):
+            return PREFIXES[value]
         return Prefix(value)
 
     @property
     def dst_addr(self) -> Union["IPv4Address", "IPv6Address"]:
-        return self.public_address if not self.public_address.is_empty else self.address
+        return self._dst_addr
 
-class PortConfiguration(BaseModel, arbitrary_types_allowed=True):
+class PortConfiguration(BaseModel, arbitrary_types_allowed=True, frozen=True):
     port_slot: int
     peer_slot: Optional[int]
     port_group: const.PortGroup
@@ -77,36 +91,48 @@ class PortConfiguration(BaseModel, arbitrary_types_allowed=True):
     # PhysicalPortProperties
     protocol_segment_profile_id: str
 
-    _profile: ProtocolSegmentProfileConfig = ProtocolSegmentProfileConfig()
+    # runtime state, assigned after validation
+    _profile: ProtocolSegmentProfileConfig = PrivateAttr(default_factory=ProtocolSegmentProfileConfig)
     # _port_config_slot: str = ""
-    _is_tx: bool = True
-    _is_rx: bool = True
+    _txrx: int = PrivateAttr(default=TX_ROLE | RX_ROLE)
+    _is_loop: bool = PrivateAttr(default=False)
+    _resolved_gateway_mac_address: Optional[MacAddress] = PrivateAttr(default=None)
+
+    def __init__(self, **data: Dict[str, Any]) -> None:
+        super().__init__(**data)
+        self._is_loop = self.port_slot == self.peer_slot
+
+    @property
+    def gateway_mac_address(self) -> "MacAddress":
+        """gateway mac resolved by ARP/NDP, falling back to the configured one"""
+        if self._resolved_gateway_mac_address is not None:
+            return self._resolved_gateway_mac_address
+        return self.ip_gateway_mac_address
 
-    @field_validator("ip_gateway_mac_address", mode="before")
-    def set_ip_gateway_mac_address(cls, value: str) -> "MacAddress":
-        return MacAddress(value)
+    def set_gateway_mac_address(self, value: "MacAddress") -> None:
+        self._resolved_gateway_mac_address = value
 
     @property
     def is_tx_port(self) -> bool:
-        return self._is_tx
+        return bool(self._txrx & TX_ROLE)
 
     def set_tx_port(self, value: bool) -> None:
-        self._is_tx = value
+        self._txrx = (self._txrx & ~TX_ROLE) | (TX_ROLE if value else 0)
 
     @property
     def is_rx_only(self) -> bool:
-        return self.is_rx_port and not self.is_tx_port
+        return self._txrx == RX_ROLE
 
     @property
     def is_rx_port(self) -> bool:
-        return self._is_rx
+        return bool(self._txrx & RX_ROLE)
 
     def set_rx_port(self, value: bool) -> None:
-        self._is_rx = value
+        self._txrx = (self._txrx & ~RX_ROLE) | (RX_ROLE if value else 0)
 
     @property
     def is_loop(self) -> bool:
-        return self.port_slot == self.peer_slot
+        return self._is_loop
 
     def is_pair(self, peer_config: "PortConfiguration") -> bool:
         return peer_config.peer_slot == self.port_slot
@@ -1,5 +1,5 @@
 from typing import Any, Dict, List, Tuple, Annotated
-from pydantic import BaseModel, Field, field_validator, ValidationInfo
+from pydantic import BaseModel, Field, field_validator, model_validator, ValidationInfo
 from ..utils import constants as const, exceptions
 
 
@@ -141,12 +141,9 @@ class TestConfigModel(BaseModel):
     multi_stream_config: MultiStreamConfig
     test_execution_config: TestExecutionConfig
 
-    @field_validator("multi_stream_config")
-    def validate_multi_stream(
-        cls, value: "MultiStreamConfig", info: ValidationInfo
-    ) -> "MultiStreamConfig":
-        if "flow_creation_type" not in info.data:
-            return value
-        if not info.data["flow_creation_type"].is_stream_based and value.enable_multi_stream:
+    @model_validator(mode="after")
+    def validate_multi_stream(self) -> "TestConfigModel":
+        flow_creation_type = self.test_execution_config.flow_creation_config.flow_creation_type
+        if not flow_creation_type.is_stream_based and self.multi_stream_config.enable_multi_stream:
             raise exceptions.ModifierBasedNotSupportMultiStream()
-        return value
+        return self
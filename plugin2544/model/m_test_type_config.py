@@ -1,5 +1,5 @@
 from typing import Any, Dict, Union, Annotated
-from pydantic import BaseModel, Field, field_validator, ValidationInfo
+from pydantic import BaseModel, Field, field_validator, model_validator, ValidationInfo
 from ..utils.constants import (
     DurationType,
     DurationUnit,
@@ -12,6 +12,12 @@ from ..utils import exceptions
 from ..utils import constants
 
 
+# largest duration per unit that keeps the frame count within MAX_PACKET_LIMIT_VALUE
+MAX_DURATION_BY_UNIT = {
+    unit: constants.MAX_PACKET_LIMIT_VALUE / unit.scale for unit in DurationUnit
+}
+
+
 class CommonOptions(BaseModel):
     duration_type: DurationType = DurationType.FRAME
     duration: float = Field(default=1, ge=1.0, le=1e9)
@@ -23,9 +29,9 @@ class CommonOptions(BaseModel):
         cls, value: "DurationUnit", info: ValidationInfo
     ) -> "DurationUnit":
         if "duration_type" in info.data and not info.data["duration_type"].is_time_duration:
-            cur = info.data["duration"] * value.scale
-            if cur > constants.MAX_PACKET_LIMIT_VALUE:
-                raise exceptions.PacketLimitOverflow(cur)
+            duration = info.data["duration"]
+            if duration > MAX_DURATION_BY_UNIT[value]:
+                raise exceptions.PacketLimitOverflow(duration * value.scale)
         return value
 
 
@@ -37,15 +43,16 @@ class RateIterationOptions(BaseModel):
     minimum_value_pct: float = Field(ge=0.0, le=100.0)
     value_resolution_pct: float = Field(ge=0.0, le=100.0)
 
-    @field_validator("initial_value_pct", "minimum_value_pct")
-    def check_if_larger_than_maximun(cls, value: float, info: ValidationInfo) -> float:
-        if "maximum_value_pct" in info.data:
-            if value > info.data["maximum_value_pct"]:
-                raise exceptions.RateRestriction(value, info.data["maximum_value_pct"])
-        return value
+    @model_validator(mode="after")
+    def check_if_larger_than_maximun(self) -> "RateIterationOptions":
+        maximum = self.maximum_value_pct
+        for value in (self.initial_value_pct, self.minimum_value_pct):
+            if value > maximum:
+                raise exceptions.RateRestriction(value, maximum)
+        return self
 
 
-class ThroughputTest(BaseModel):
+class ThroughputTest(BaseModel, defer_build=True):
     enabled: bool
     common_options: CommonOptions
     rate_iteration_options: RateIterationOptions
@@ -89,7 +96,7 @@ class BurstSizeIterationOptions(BaseModel):
     #     self.step_value_pct = self.step_value_pct * throughput_rate / 100
 
 
-class LatencyTest(BaseModel):
+class LatencyTest(BaseModel, defer_build=True):
     enabled: bool
     common_options: CommonOptions
     rate_sweep_options: RateSweepOptions
@@ -97,7 +104,7 @@ class LatencyTest(BaseModel):
     use_relative_to_throughput: bool
 
 
-class FrameLossRateTest(BaseModel):
+class FrameLossRateTest(BaseModel, defer_build=True):
     enabled: bool
     common_options: CommonOptions
     rate_sweep_options: RateSweepOptions
@@ -113,7 +120,7 @@ class FrameLossRateTest(BaseModel):
     pass_criteria_loss_type: AcceptableLossType
 
 
-class BackToBackTest(BaseModel):
+class BackToBackTest(BaseModel, defer_build=True):
     enabled: bool
     common_options: CommonOptions
     rate_sweep_options: RateSweepOptions
@@ -123,7 +130,7 @@ class BackToBackTest(BaseModel):
 AllTestType = Union[ThroughputTest, LatencyTest, FrameLossRateTest, BackToBackTest]
 
 
-class TestTypesConfiguration(BaseModel):
+class TestTypesConfiguration(BaseModel, defer_build=True):
     throughput_test: ThroughputTest
     latency_test: LatencyTest
     frame_loss_rate_test: FrameLossRateTest
@@ -74,7 +74,7 @@ async def set_arp_request(
             YOU have the responsibility to store the MAC address and use it in the test stream configuration phase as the DMAC of all streams on the port. 
             This dummy stream has served its purpose and can be deleted afterwards.
             """
-            port_struct.port_conf.ip_gateway_mac_address = arp_mac
+            port_struct.port_conf.set_gateway_mac_address(arp_mac)
         return arp_mac
     else:
         return MacAddress()
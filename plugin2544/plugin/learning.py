@@ -95,7 +95,7 @@ async def get_address_learning_packet(
     gateway = port_struct.port_conf.ip_address.gateway
     sender_ip = port_struct.port_conf.ip_address.address
     if use_gateway and not gateway.is_empty:
-        gwmac = port_struct.port_conf.ip_gateway_mac_address
+        gwmac = port_struct.port_conf.gateway_mac_address
         if not gwmac.is_empty:
             dmac = gwmac
     smac = (
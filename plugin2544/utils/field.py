@@ -6,6 +6,8 @@ from ipaddress import (
     IPv4Network,
     IPv6Network,
 )
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
 from ..model.m_protocol_segment import BinaryString
 from . import exceptions
 
@@ -13,7 +15,9 @@ from . import exceptions
 def hex_string_to_binary_string(hex: str) -> "BinaryString":
     """binary string with leading zeros"""
     hex = hex.lower().replace("0x", "")
-    return BinaryString(bin(int("1" + hex, 16))[3:])
+    if not hex:
+        return BinaryString("")
+    return BinaryString(format(int(hex, 16), f"0{len(hex) * 4}b"))
 
 
 class HexString(str):
@@ -22,6 +26,10 @@ class HexString(str):
 
 
 class MacAddress(str):
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        return core_schema.no_info_after_validator_function(cls, handler(str))
+
     def __new__(cls, *args: Any, **kwargs: Dict[str, Any]) -> "MacAddress":
         value = str.__new__(cls, *args, **kwargs)
         if not value:
@@ -83,7 +91,7 @@ class IPv4Address(OldIPv4Address):
         return bytearray(self.packed)
 
     def network(self, prefix: int) -> IPv4Network:
-        return IPv4Network(f"{self}/{prefix}", strict=False)
+        return IPv4Network((self, prefix), strict=False)
 
     @property
     def is_empty(self) -> bool:
@@ -108,7 +116,7 @@ class IPv6Address(OldIPv6Address):
         return not self or self == IPv6Address("::")
 
     def network(self, prefix: int) -> IPv6Network:
-        return IPv6Network(f"{self}/{prefix}", strict=False)
+        return IPv6Network((self, prefix), strict=False)
 
     def to_binary_string(self) -> "BinaryString":
         return hex_string_to_binary_string(self.to_hexstring())
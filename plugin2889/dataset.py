@@ -1,10 +1,9 @@
 import sys
-from statistics import fmean
 from dataclasses import dataclass, field
 from decimal import Decimal
-from numbers import Number
 from typing import Dict, List, NamedTuple, Tuple
-from operator import attrgetter
+from operator import attrgetter, mul
+from functools import cached_property, lru_cache
 from ipaddress import (
     IPv4Address as OldIPv4Address,
     IPv6Address as OldIPv6Address,
@@ -13,12 +12,12 @@ from ipaddress import (
 )
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from collections import defaultdict
 from dataclasses import dataclass, field
 from ipaddress import IPv4Network, IPv6Network
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Generator,
     Iterable,
     List,
@@ -30,6 +29,7 @@ from pydantic import (
     BaseModel,
     NonNegativeInt,
     Field,
+    PrivateAttr,
     field_validator,
 )
 from xoa_driver import ports
@@ -102,20 +102,27 @@ class PortRoleCounter(BaseModel):
 
 class PortRoleHandler(BaseModel):
     role_map: Dict[str, PortRoleConfig]  # key is guid_{uuid} "guid_fed2f488-a81e-4bbd-9eaa-16b10748ba33"
+    _role_counter: Optional["PortRoleCounter"] = PrivateAttr(default=None)
 
     @property
     def used_port_count(self) -> int:
-        return sum(int(port.is_used) for port in self.role_map.values())
+        return self.role_counter.enabled
 
     @property
     def role_counter(self) -> "PortRoleCounter":
-        counter = PortRoleCounter()
-        for port in self.role_map.values():
-            if port.is_used:
-                counter.enabled += 1
-            current = counter.by_roles.get(port.role, 0)
-            counter.by_roles[port.role] = current + 1
-        return counter
+        # role_map is not modified after validation, so count once and reuse
+        if self._role_counter is None:
+            enabled = 0
+            by_roles: Dict[PortGroup, int] = {}
+            for port in self.role_map.values():
+                if port.is_used:
+                    enabled += 1
+                by_roles[port.role] = by_roles.get(port.role, 0) + 1
+            self._role_counter = PortRoleCounter(enabled=enabled, by_roles=by_roles)
+        return self._role_counter
+
+
+ADDRESS_TEST_PORT_ROLES = (PortGroup.LEARNING_PORT, PortGroup.MONITORING_PORT, PortGroup.TEST_PORT)
 
 
 class TestCaseBaseConfiguration(ABC, BaseModel):
@@ -133,22 +140,28 @@ class TestCaseBaseConfiguration(ABC, BaseModel):
 
     def check_src_dest_port_roles(self, require_src_ports: int, require_dest_ports: int) -> None:
         assert self.port_role_handler, INVALID_PORT_ROLE
-        if self.port_role_handler.role_counter.enabled != require_src_ports + require_dest_ports:
-            raise exceptions.PortRoleEnabledNotEnough(require_src_ports + require_dest_ports)
-
-        if self.port_role_handler.role_counter.read(PortGroup.SOURCE) != require_src_ports:
+        # role_counter is the cached single pass over role_map
+        role_counter = self.port_role_handler.role_counter
+        by_roles = role_counter.by_roles
+        require_ports = require_src_ports + require_dest_ports
+        if role_counter.enabled != require_ports:
+            raise exceptions.PortRoleEnabledNotEnough(require_ports)
+
+        if by_roles.get(PortGroup.SOURCE, 0) != require_src_ports:
             raise exceptions.PortRoleNotEnough('source', require_src_ports)
 
-        if self.port_role_handler.role_counter.read(PortGroup.DESTINATION) != require_dest_ports:
-            raise exceptions.PortRoleNotEnough('destination', require_src_ports)
+        if by_roles.get(PortGroup.DESTINATION, 0) != require_dest_ports:
+            raise exceptions.PortRoleNotEnough('destination', require_dest_ports)
 
     def check_address_test_port_roles(self) -> None:
         assert self.port_role_handler, INVALID_PORT_ROLE
-        if self.port_role_handler.role_counter.enabled != 3:
+        role_counter = self.port_role_handler.role_counter
+        if role_counter.enabled != 3:
             raise exceptions.PortRoleEnabledNotEnough(3)
 
-        for role in (PortGroup.LEARNING_PORT, PortGroup.MONITORING_PORT, PortGroup.TEST_PORT):
-            if self.port_role_handler.role_counter.read(role) != 1:
+        by_roles = role_counter.by_roles
+        for role in ADDRESS_TEST_PORT_ROLES:
+            if by_roles.get(role, 0) != 1:
                 raise exceptions.PortRoleNotEnough(role.value, 1)
 
     @abstractmethod
@@ -285,13 +298,14 @@ class BroadcastForwardingConfiguration(TestCaseBaseConfiguration):
 
     def check_configuration(self) -> None:
         assert self.port_role_handler, INVALID_PORT_ROLE
-        if self.port_role_handler.role_counter.enabled < 2:
+        role_counter = self.port_role_handler.role_counter
+        if role_counter.enabled < 2:
             raise exceptions.PortConfigNotEnough(2)
 
-        if self.port_role_handler.role_counter.read(PortGroup.SOURCE) != 1:
+        if role_counter.read(PortGroup.SOURCE) != 1:
             raise exceptions.PortConfigNotMatchExactly(PortGroup.SOURCE.value, 1)
 
-        if self.port_role_handler.role_counter.read(PortGroup.DESTINATION) < 1:
+        if role_counter.read(PortGroup.DESTINATION) < 1:
             raise exceptions.PortRoleNotEnoughAtLeast(PortGroup.DESTINATION.value, 1)
 
 
@@ -313,7 +327,6 @@ UnionTestSuitConfiguration = Union[
 class TestSuitesConfiguration(BaseModel):
     class Config:
         arbitrary_types_allowed = True
-        validate_assignment = True
 
     rate_test: RateTestConfiguration
     congestion_control: CongestionControlConfiguration
@@ -363,19 +376,34 @@ class RateDefinition(BaseModel):
 @ dataclass
 class TPLDIDController:
     tid_allocation_scope: TidAllocationScope
-    current_rx_port_tid: Dict["GenericL23Port", int] = field(default_factory=lambda: defaultdict(lambda: 0))
+    current_rx_port_tid: Dict["GenericL23Port", int] = field(default_factory=dict)
     current_tid: int = 0
     next_tid: int = 0
+    _next_tid_function: Callable[["GenericL23Port", "GenericL23Port"], int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # the scope is fixed per test configuration, so pick its allocator once
+        self._next_tid_function = {
+            TidAllocationScope.CONFIGURATION_SCOPE: self._next_configuration_tid,
+            TidAllocationScope.RX_PORT_SCOPE: self._next_rx_port_tid,
+            TidAllocationScope.SOURCE_PORT_ID: self._next_source_port_tid,
+        }[self.tid_allocation_scope]
+
+    def _next_configuration_tid(self, source_port: "GenericL23Port", destination_port: "GenericL23Port") -> int:
+        tid = self.current_tid
+        self.current_tid = tid + 1
+        return tid
+
+    def _next_rx_port_tid(self, source_port: "GenericL23Port", destination_port: "GenericL23Port") -> int:
+        tid = self.current_rx_port_tid.get(destination_port, 0)
+        self.current_rx_port_tid[destination_port] = tid + 1
+        return tid
+
+    def _next_source_port_tid(self, source_port: "GenericL23Port", destination_port: "GenericL23Port") -> int:
+        return source_port.kind.port_id
 
     def alloc_new_tpld_id(self, source_port: "GenericL23Port", destination_port: "GenericL23Port") -> int:
-        if self.tid_allocation_scope == TidAllocationScope.CONFIGURATION_SCOPE:
-            self.next_tid = self.current_tid
-            self.current_tid += 1
-        elif self.tid_allocation_scope == TidAllocationScope.RX_PORT_SCOPE:
-            self.next_tid = self.current_rx_port_tid[destination_port]
-            self.current_rx_port_tid[destination_port] += 1
-        elif self.tid_allocation_scope == TidAllocationScope.SOURCE_PORT_ID:
-            self.next_tid = source_port.kind.port_id
+        self.next_tid = self._next_tid_function(source_port, destination_port)
 
         if self.next_tid > source_port.info.capabilities.max_tpld_stats:
             exceptions.TPLDIDExceed(self.next_tid, source_port.info.capabilities.max_tpld_stats)
@@ -422,8 +450,12 @@ class FrameSizeConfiguration(BaseModel):
             if sum(self.mixed_sizes_weights) != 100:
                 raise exceptions.MixWeightsSumError(sum(self.mixed_sizes_weights))
 
-    @property
-    def mixed_packet_length(self) -> List[int]:
+    # derived from the validated fields once, in __init__ / on first access
+    _mixed_packet_length: List[int] = PrivateAttr(default_factory=list)
+    _mixed_average_packet_size: Optional[int] = PrivateAttr(default=None)
+    _packet_size_list: Tuple[int, ...] = PrivateAttr(default=())
+
+    def _build_mixed_packet_length(self) -> List[int]:
         mix_size_lengths = self.mixed_length_config.dict()
         return [
             DEFAULT_MIXED_PACKET_SIZE[index]
@@ -432,39 +464,48 @@ class FrameSizeConfiguration(BaseModel):
             for index in range(len(DEFAULT_MIXED_PACKET_SIZE))
         ]
 
-    @property
-    def mixed_average_packet_size(self) -> int:
-        weighted_size = 0.0
-        for index, size in enumerate(self.mixed_packet_length):
-            weight = self.mixed_sizes_weights[index]
-            weighted_size += size * weight
-        return int(round(weighted_size / 100.0))
-
-    @property
-    def packet_size_list(self) -> Iterable[int]:
+    def _build_packet_size_list(self) -> Tuple[int, ...]:
         packet_size_type = self.packet_size_type
         if packet_size_type == PacketSizeType.IETF_DEFAULT:
             return DEFAULT_IETF_PACKET_SIZE
         elif packet_size_type == PacketSizeType.CUSTOM_SIZES:
-            return list(sorted(self.custom_packet_sizes))
+            return tuple(sorted(self.custom_packet_sizes))
         elif packet_size_type == PacketSizeType.MIX:
-            return [self.mixed_average_packet_size]
+            return (self.mixed_average_packet_size,)
 
         elif packet_size_type == PacketSizeType.RANGE:
-            return list(range(
+            return tuple(range(
                 self.fixed_packet_start_size,
                 self.fixed_packet_end_size + self.fixed_packet_step_size,
                 self.fixed_packet_step_size,
             ))
 
         elif packet_size_type in (PacketSizeType.INCREMENTING, PacketSizeType.BUTTERFLY, PacketSizeType.RANDOM):
-            return [(self.varying_packet_min_size + self.varying_packet_max_size) // 2]
+            return ((self.varying_packet_min_size + self.varying_packet_max_size) // 2,)
         else:
             raise ValueError(packet_size_type.value)
 
+    @property
+    def mixed_packet_length(self) -> List[int]:
+        return self._mixed_packet_length
+
+    @property
+    def mixed_average_packet_size(self) -> int:
+        # lazy: the weights are only checked against the 16 mixed sizes for MIX
+        if self._mixed_average_packet_size is None:
+            weighted_size = sum(map(mul, self.mixed_packet_length, self.mixed_sizes_weights))
+            self._mixed_average_packet_size = int(round(weighted_size / 100.0))
+        return self._mixed_average_packet_size
+
+    @property
+    def packet_size_list(self) -> Tuple[int, ...]:
+        return self._packet_size_list
+
     def __init__(self, **data: Any):
         super().__init__(**data)
         self.check_mixed_weights_valid()
+        self._mixed_packet_length = self._build_mixed_packet_length()
+        self._packet_size_list = self._build_packet_size_list()
 
 
 class GeneralTestConfiguration(BaseModel):
@@ -498,49 +539,60 @@ class PortIdentity(BaseModel):
     module_index: NonNegativeInt
     port_index: NonNegativeInt
 
-    @property
+    @cached_property
     def name(self) -> str:
         return f"P-{self.tester_id}-{self.module_index}-{self.port_index}"
 
-    @property
+    @cached_property
     def identity(self) -> str:
         return f"{self.tester_id}-{self.module_index}-{self.port_index}"
 
 
+# addresses are immutable and reused for every stream, so their bit strings are memoised
+@lru_cache(maxsize=4096)
 def hex_string_to_binary_string(hex: str) -> "BinaryString":
     """binary string with leading zeros
     """
     hex = hex.lower().replace('0x', '')
-    return BinaryString(bin(int('1' + hex, 16))[3:])
+    if not hex:
+        return BinaryString('')
+    return BinaryString(format(int(hex, 16), f'0{len(hex) * 4}b'))
 
 
 class MacAddress(str):
+    # the value of a str never changes, so the derived forms are kept in the instance __dict__
     def to_hexstring(self):
-        return self.replace(":", "").replace("-", "").upper()
+        hexstring = self.__dict__.get("_hexstring")
+        if hexstring is None:
+            hexstring = self.__dict__["_hexstring"] = self.replace(":", "").replace("-", "").upper()
+        return hexstring
 
     def first_three_bytes(self):
-        return self.replace(":", "").replace("-", "").upper()[:6]
+        return self.to_hexstring()[:6]
 
     def partial_replace(self, new_mac_address: "MacAddress"):
         return MacAddress(f"{new_mac_address}{self[len(new_mac_address):]}".lower())
 
     @classmethod
     def from_base_address(cls, base_address: str):
-        prefix = [hex(int(i)) for i in base_address.split(",")]
-        return cls("".join([p.replace("0x", "").zfill(2).upper() for p in prefix]))
+        return cls(bytes(int(i) for i in base_address.split(",")).hex().upper())
 
     @property
     def is_empty(self) -> bool:
         return not self or self == MacAddress("00:00:00:00:00:00")
 
     def to_bytearray(self) -> bytearray:
-        return bytearray(bytes.fromhex(self.to_hexstring()))
+        packed = self.__dict__.get("_packed")
+        if packed is None:
+            packed = self.__dict__["_packed"] = bytes.fromhex(self.to_hexstring())
+        return bytearray(packed)
 
     def to_binary_string(self) -> "BinaryString":
-        return hex_string_to_binary_string(self.replace(':', ''))
+        return hex_string_to_binary_string(self.to_hexstring())
 
 
-class PortPair(BaseModel):
+@dataclass(slots=True)
+class PortPair:
     west: str
     east: str
 
@@ -549,25 +601,33 @@ class PortPair(BaseModel):
         return self.west, self.east
 
 
-class ResultData(BaseModel):
+@dataclass(slots=True)
+class ResultData:
     result: List
 
 
-class TestStatusModel(BaseModel):
+@dataclass(slots=True)
+class TestStatusModel:
     status: const.TestStatus = const.TestStatus.STOP
 
 
-class TxStream(BaseModel):
+@dataclass(slots=True)
+class TxStream:
     tpld_id: int
     packet: int = 0
     pps: int = 0
 
 
-class RxTPLDId(BaseModel):
+@dataclass(slots=True)
+class RxTPLDId:
     packet: int = 0
     pps: int = 0
 
 
+# PortLatency drops samples at or below ~sys.maxsize microseconds
+LATENCY_NS_LOWER_LIMIT = ~sys.maxsize * 1000
+
+
 @dataclass
 class PortLatency:
     check_value_ = True
@@ -575,18 +635,23 @@ class PortLatency:
     minimum_: Decimal = Decimal(0)
     maximum_: Decimal = Decimal(0)
 
-    def _pre_process(self, value: Decimal) -> Decimal:
-        value = round(value / Decimal(1000), 3)
-        if self.check_value_ and not value > ~sys.maxsize:
-            value = Decimal(0)
-        return value
+    def __post_init__(self) -> None:
+        # running total of average_, a plain attribute so it is not reported as a field
+        self._average_sum = sum(self.average_.values(), Decimal(0))
+
+    def _pre_process(self, value: int) -> Decimal:
+        # the chassis reports integer nanoseconds: check the raw int and shift to
+        # microseconds with scaleb, which is exact and avoids Decimal division
+        if self.check_value_ and not value > LATENCY_NS_LOWER_LIMIT:
+            return Decimal(0)
+        return Decimal(value).scaleb(-3)
 
     @property
     def minimum(self) -> Decimal:
         return self.minimum_
 
     @minimum.setter
-    def minimum(self, value: Decimal) -> None:
+    def minimum(self, value: int) -> None:
         if value := self._pre_process(value):
             self.minimum_ = min(value, self.minimum_) if self.minimum_ else value
 
@@ -595,15 +660,18 @@ class PortLatency:
         return self.maximum_
 
     @maximum.setter
-    def maximum(self, value: Decimal) -> None:
+    def maximum(self, value: int) -> None:
         self.maximum_ = max(self._pre_process(value), self.maximum_)
 
     @property
     def average(self) -> Decimal:
-        return Decimal(fmean(self.average_.values()))
+        if not self.average_:
+            return Decimal(0)
+        return self._average_sum / len(self.average_)
 
-    def set_average(self, tpld_id: int, value: Decimal) -> None:
+    def set_average(self, tpld_id: int, value: int) -> None:
         if value := self._pre_process(value):
+            self._average_sum += value - self.average_.get(tpld_id, 0)
             self.average_[tpld_id] = value
 
 
@@ -630,11 +698,28 @@ class StatisticsData(BaseModel):
     jitter: PortJitter = PortJitter()
 
     def __add__(self, other: "StatisticsData") -> "StatisticsData":
-        for name, value in self:
-            if isinstance(value, Number):
-                setattr(self, name, value + attrgetter(name)(other))
+        for name in _STATISTICS_NUMERIC_FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
         return self
 
+    @classmethod
+    def aggregate(cls, statistics_list: Iterable["StatisticsData"]) -> "StatisticsData":
+        """sum the counter fields of several statistics, one field at a time"""
+        statistics_list = tuple(statistics_list)
+        total = cls()
+        for name in _STATISTICS_NUMERIC_FIELDS:
+            setattr(total, name, sum(map(attrgetter(name), statistics_list)))
+        return total
+
+
+# counter fields summed by StatisticsData.__add__, resolved once at import;
+# the type set stands in for the numbers.Number check __add__ used to do per value
+_NUMERIC_TYPES = frozenset((int, float, Decimal))
+_STATISTICS_NUMERIC_FIELDS = tuple(
+    name for name, field_info in StatisticsData.model_fields.items()
+    if field_info.annotation in _NUMERIC_TYPES
+)
+
 
 class CurrentIterProps(NamedTuple):
     iteration_number: int
@@ -660,6 +745,12 @@ MdixPorts = (
     ports.POdin1G3S2PT,
 )
 
+# the port classes use ABCMeta, so isinstance against the tuples above runs an
+# ABC check per entry; an exact type lookup answers the listed classes first and
+# the tuples stay as the isinstance fallback for driver subclasses
+AUTO_NEG_PORT_TYPES = frozenset(AutoNegPorts)
+MDIX_PORT_TYPES = frozenset(MdixPorts)
+
 
 class IPv4Address(OldIPv4Address):
     def to_hexstring(self) -> str:
@@ -708,7 +799,7 @@ class Prefix(int):
 
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AddressCollection:
     smac: MacAddress
     dmac: MacAddress
@@ -816,9 +907,18 @@ class PortConfiguration(BaseModel, arbitrary_types_allowed=True):
     is_rx_port: bool = True
     port_rate: Decimal = Decimal("0.0")
     profile: ProtocolSegmentProfileConfig = ProtocolSegmentProfileConfig()
+    _owns_profile: bool = PrivateAttr(default=False)
 
-    @property
+    def own_profile(self) -> ProtocolSegmentProfileConfig:
+        """profile is shared by every port with the same profile_id, copy it before changing it for this port"""
+        if not self._owns_profile:
+            self.profile = self.profile.copy(deep=True)
+            self._owns_profile = True
+        return self.profile
+
+    @cached_property
     def ip_properties(self) -> Union[IPV4AddressProperties, IPV6AddressProperties]:
+        # first read happens after TestSuiteConfiguration2889 has assigned the profile
         if self.profile.protocol_version.is_ipv6:
             return self.ipv6_properties
         return self.ipv4_properties
@@ -851,5 +951,8 @@ class TestSuiteConfiguration2889(BaseModel):
         self.check_port_config()
         self.check_tests_enabled()
 
+        # ports only read their profile (StreamManager.header copies it before
+        # writing addresses), so they share it; PortConfiguration.own_profile
+        # makes a private copy for a port that needs to change it
         for port_conf in self.ports_configuration.values():
-            port_conf.profile = self.protocol_segments[port_conf.profile_id].copy(deep=True)
\ No newline at end of file
+            port_conf.profile = self.protocol_segments[port_conf.profile_id]
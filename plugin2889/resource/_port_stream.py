@@ -13,8 +13,8 @@ if TYPE_CHECKING:
 from plugin2889.dataset import RateDefinition
 from plugin2889.plugin import rate_helper
 from plugin2889.plugin import utils
-from plugin2889.dataset import AddressCollection, IPv4Address, IPv6Address, MacAddress
-from plugin2889.const import DEFAULT_INTERFRAME_GAP, PacketSizeType
+from plugin2889.dataset import AddressCollection, MacAddress
+from plugin2889.const import DEFAULT_INTERFRAME_GAP, PacketSizeType, StreamRateType
 
 
 class StreamManager:
@@ -34,10 +34,11 @@ class StreamManager:
         return AddressCollection(
             smac=self.__resource.mac_address,
             dmac=self.__peer_mac or self.__peer_resource.mac_address,
-            src_ipv4_addr=IPv4Address(self.__resource.port_config.ipv4_properties.address),
-            dst_ipv4_addr=IPv4Address(self.__peer_resource.port_config.ipv4_properties.dst_addr),
-            src_ipv6_addr=IPv6Address(self.__resource.port_config.ipv6_properties.address),
-            dst_ipv6_addr=IPv6Address(self.__peer_resource.port_config.ipv6_properties.dst_addr),
+            # the address properties already hold validated IPv4Address/IPv6Address instances
+            src_ipv4_addr=self.__resource.port_config.ipv4_properties.address,
+            dst_ipv4_addr=self.__peer_resource.port_config.ipv4_properties.dst_addr,
+            src_ipv6_addr=self.__resource.port_config.ipv6_properties.address,
+            dst_ipv6_addr=self.__peer_resource.port_config.ipv6_properties.dst_addr,
         )
 
     @property
@@ -126,7 +127,7 @@ class StreamManager:
             self.set_packet_limit(math.floor(stream_packet_rate * traffic_duration)),
         ))
 
-    async def set_rate_and_packet_limit_pps(self, rate_percent: Decimal, traffic_duration: int, rate_definition: RateDefinition) -> None:
+    async def set_rate_and_packet_limit_pps(self, packet_size: int, rate_percent: Decimal, traffic_duration: int, rate_definition: RateDefinition) -> None:
         pps = math.floor(rate_percent * Decimal(rate_definition.rate_pps) / Decimal(100) / self.total_stream_count)
         await asyncio.gather(*(
             self.set_rate_pps(pps),
@@ -156,11 +157,13 @@ class StreamManager:
         packet_size = packet_size or self.packet_size
         #logger.debug(f'{self}, {packet_size} {rate_percent} {traffic_duration}')
 
-        if rate_definition.is_fraction:
-            await self.set_rate_and_packet_limit_fraction(packet_size, rate_percent, traffic_duration, rate_definition)
-        elif rate_definition.is_pps:
-            await self.set_rate_and_packet_limit_pps(rate_percent, traffic_duration, rate_definition)
-        elif rate_definition.is_l1bps:
-            await self.set_rate_and_packet_limit_l1bps(packet_size, rate_percent, traffic_duration, rate_definition)
-        elif rate_definition.is_l2bps:
-            await self.set_rate_and_packet_limit_l2bps(packet_size, rate_percent, traffic_duration, rate_definition)
+        set_rate_function = self.__RATE_AND_PACKET_LIMIT_FUNCTIONS[rate_definition.rate_type]
+        await set_rate_function(self, packet_size, rate_percent, traffic_duration, rate_definition)
+
+    # rate type -> setter, looked up once per call instead of testing each is_* flag
+    __RATE_AND_PACKET_LIMIT_FUNCTIONS = {
+        StreamRateType.FRACTION: set_rate_and_packet_limit_fraction,
+        StreamRateType.PPS: set_rate_and_packet_limit_pps,
+        StreamRateType.L1BPS: set_rate_and_packet_limit_l1bps,
+        StreamRateType.L2BPS: set_rate_and_packet_limit_l2bps,
+    }
@@ -13,7 +13,7 @@ from xoa_driver.misc import Hex
 
 from plugin2889.const import DELAY_LEARNING_MAC, INTERVAL_CHECK_PORT_RESERVE, FECModeStr
 from plugin2889.model import exceptions
-from plugin2889.dataset import AutoNegPorts, IPv4Address, IPv6Address, MacAddress, MdixPorts
+from plugin2889.dataset import AUTO_NEG_PORT_TYPES, MDIX_PORT_TYPES, AutoNegPorts, IPv4Address, IPv6Address, MacAddress, MdixPorts
 from plugin2889.resource._port_stream import StreamManager
 from plugin2889.resource._port_statistics import PortStatistics
 from plugin2889.resource._traffic import Traffic
@@ -245,7 +245,7 @@ class TestResource:
     async def set_port_autoneg(self) -> None:
         if not self.port_config.auto_neg_enabled:
             return None
-        if not self.port.info.capabilities.can_set_autoneg or not isinstance(self.port, AutoNegPorts):
+        if not self.port.info.capabilities.can_set_autoneg or not (type(self.port) in AUTO_NEG_PORT_TYPES or isinstance(self.port, AutoNegPorts)):
             logger.debug(f"{self.port} not support autoneg")
             return None
         await self.port.autoneg_selection.set(enums.OnOff.ON)
@@ -298,7 +298,7 @@ class TestResource:
             logger.debug(f"{self.port} not support mdi_mdix")
             return None
 
-        if isinstance(self.port, MdixPorts):
+        if type(self.port) in MDIX_PORT_TYPES or isinstance(self.port, MdixPorts):
             self.port.mdix_mode.set(self.port_config.mdi_mdix_mode.to_xmp())
 
     async def set_port_fec(self) -> None:
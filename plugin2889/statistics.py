@@ -56,22 +56,22 @@ class StatisticsProcessor:
         is_live=True,
         get_rate_function: Optional[Callable[[], Decimal]] = None,
     ) -> "ResultData":
-        total: StatisticsData = StatisticsData()
         row_data = ResultData(
             test_type=self.__test_type,
             iteration=iteration,
             packet_size=packet_size,
             rate=get_rate_function() if get_rate_function else rate,
-            total=total,
+            total=StatisticsData(),
             status=const.StatisticsStatus.PENDING,
             is_live=is_live,
         )
         coroutines = [r.statistics.collect_data(duration, packet_size, is_live) for r in self.__resources]
-        for port_name, statistics in await asyncio.gather(*coroutines):
-            total += statistics
+        port_statistics = await asyncio.gather(*coroutines)
+        for port_name, statistics in port_statistics:
             row_data.ports[port_name] = statistics
-            if not is_live:
-                total.loss = total.tx_packet - total.rx_packet
+        total = StatisticsData.aggregate(statistics for _, statistics in port_statistics)
+        if not is_live:
+            total.loss = total.tx_packet - total.rx_packet
 
         total.loss_percent = round(Decimal(total.loss * 100 / total.tx_packet if total.tx_packet else 0), 2)
         row_data.total = total
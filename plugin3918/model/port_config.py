@@ -1,4 +1,6 @@
-from pydantic import BaseModel, NonNegativeInt
+from functools import cached_property
+from typing import Any, ClassVar, Optional, Type, Union
+from pydantic import BaseModel, NonNegativeInt, PrivateAttr, ValidationInfo, field_validator
 from ..utils.errors import IpEmpty, NoIpSegment, NoRole
 
 from ..utils.constants import (
@@ -13,67 +15,67 @@ from ..utils.constants import (
 )
 from ..utils.field import MacAddress, NewIPv4Address, NewIPv6Address, Prefix
 from .protocol_segments import ProtocolSegmentProfileConfig
-from pydantic import field_validator
-from typing import Union
 
 
-class IPV6AddressProperties(BaseModel, arbitrary_types_allowed=True):
-    address: NewIPv6Address = NewIPv6Address("::")
+# shared sentinels for the unset address checks below
+IPV4_ZERO = NewIPv4Address("0.0.0.0")
+IPV6_ZERO = NewIPv6Address("::")
+IPV4_EMPTY_VALUES = frozenset((IPV4_ZERO, ""))
+IPV6_EMPTY_VALUES = frozenset((IPV6_ZERO, ""))
+
+
+# shared by the IPv4/IPv6 port properties, subclasses declare the typed address fields
+class IPAddressProperties(BaseModel):
+    address_type: ClassVar[Type[Union[NewIPv4Address, NewIPv6Address]]]
+
     routing_prefix: Prefix = Prefix(24)
-    public_address: NewIPv6Address = NewIPv6Address("::")
     public_routing_prefix: Prefix = Prefix(24)
-    gateway: NewIPv6Address = NewIPv6Address("::")
-    remote_loop_address: NewIPv6Address = NewIPv6Address("::")
-    ip_version: IPVersion = IPVersion.IPV6
 
     @staticmethod
-    def is_ip_zero(ip_address: NewIPv6Address) -> bool:
-        return ip_address == NewIPv6Address("::") or (not ip_address)
-
-    @field_validator("address", "public_address", "gateway", "remote_loop_address", mode="before")
-    def set_address(cls, v):
-        return NewIPv6Address(v)
+    def is_ip_zero(ip_address: Union[NewIPv4Address, NewIPv6Address]) -> bool:
+        return not ip_address or int(ip_address) == 0
+
+    @field_validator(
+        "address", "public_address", "gateway", "remote_loop_address", mode="before", check_fields=False
+    )
+    def set_address(
+        cls, v: Union[str, int, NewIPv4Address, NewIPv6Address]
+    ) -> Union[NewIPv4Address, NewIPv6Address]:
+        address_type = cls.address_type
+        return v if isinstance(v, address_type) else address_type(v)
 
     @field_validator("routing_prefix", "public_routing_prefix", mode="before")
-    def set_prefix(cls, v):
-        return Prefix(v)
+    def set_prefix(cls, v: int) -> Prefix:
+        return v if isinstance(v, Prefix) else Prefix(v)
 
     @property
-    def usable_dest_ip_address(self) -> NewIPv6Address:
+    def usable_dest_ip_address(self) -> Union[NewIPv4Address, NewIPv6Address]:
         if not self.public_address.is_empty:
             return self.public_address
         return self.address
 
 
-class IPV4AddressProperties(BaseModel, arbitrary_types_allowed=True):
-    address: NewIPv4Address = NewIPv4Address("0.0.0.0")
-    routing_prefix: Prefix = Prefix(24)
-    public_address: NewIPv4Address = NewIPv4Address("0.0.0.0")
-    public_routing_prefix: Prefix = Prefix(24)
-    gateway: NewIPv4Address = NewIPv4Address("0.0.0.0")
-    remote_loop_address: NewIPv4Address = NewIPv4Address("0.0.0.0")
-    ip_version: IPVersion = IPVersion.IPV4
+class IPV6AddressProperties(IPAddressProperties):
+    address_type: ClassVar[Type[NewIPv6Address]] = NewIPv6Address
 
-    @staticmethod
-    def is_ip_zero(ip_address: NewIPv4Address) -> bool:
-        return ip_address == NewIPv4Address("0.0.0.0") or (not ip_address)
+    address: NewIPv6Address = IPV6_ZERO
+    public_address: NewIPv6Address = IPV6_ZERO
+    gateway: NewIPv6Address = IPV6_ZERO
+    remote_loop_address: NewIPv6Address = IPV6_ZERO
+    ip_version: IPVersion = IPVersion.IPV6
 
-    @field_validator("address", "public_address", "gateway", "remote_loop_address", mode="before")
-    def set_address(cls, v):
-        return NewIPv4Address(v)
 
-    @field_validator("routing_prefix", "public_routing_prefix", mode="before")
-    def set_prefix(cls, v):
-        return Prefix(v)
+class IPV4AddressProperties(IPAddressProperties):
+    address_type: ClassVar[Type[NewIPv4Address]] = NewIPv4Address
 
-    @property
-    def usable_dest_ip_address(self) -> NewIPv4Address:
-        if not self.public_address.is_empty:
-            return self.public_address
-        return self.address
+    address: NewIPv4Address = IPV4_ZERO
+    public_address: NewIPv4Address = IPV4_ZERO
+    gateway: NewIPv4Address = IPV4_ZERO
+    remote_loop_address: NewIPv4Address = IPV4_ZERO
+    ip_version: IPVersion = IPVersion.IPV4
 
 
-class PortConfiguration(BaseModel, arbitrary_types_allowed=True):
+class PortConfiguration(BaseModel, frozen=True):
     port_slot: str
     port_config_slot: str = ""
     # port_group: PortGroup
@@ -111,36 +113,59 @@ class PortConfiguration(BaseModel, arbitrary_types_allowed=True):
     profile: ProtocolSegmentProfileConfig
     multicast_role: MulticastRole
 
+    # runtime state, assigned after validation
+    _resolved_gateway_mac_address: Optional[MacAddress] = PrivateAttr(default=None)
+
+    def __hash__(self) -> int:
+        # port_slot is unique per port and equal configs share it
+        return hash(self.port_slot)
+
     @field_validator("ip_gateway_mac_address", "remote_loop_mac_address", mode="before")
-    def validate_mac(cls, v):
-        return MacAddress(v)
+    def validate_mac(cls, v: str) -> MacAddress:
+        return v if isinstance(v, MacAddress) else MacAddress(v)
 
-    @field_validator("multicast_role", mode="before")
-    def validate_multicast_role(cls, v, values):
-        if v == MulticastRole.UNDEFINED:
-            raise NoRole(values["port_slot"])
+    @field_validator("multicast_role")
+    def validate_multicast_role(cls, v: MulticastRole, info: ValidationInfo) -> MulticastRole:
+        if v is MulticastRole.UNDEFINED:
+            raise NoRole(info.data["port_slot"])
         return v
 
     @field_validator("profile")
-    def validate_ip(cls, v, values):
-        has_ip_segment = False
-        segment_types = [i.type for i in v.header_segments]
-        if ProtocolOption.IPV4 in segment_types:
-            has_ip_segment = True
-            if values["ipv4_properties"].address in {NewIPv4Address("0.0.0.0"), ""}:
-                raise IpEmpty(values["port_slot"], "IPv4")
-        elif ProtocolOption.IPV6 in segment_types:
-            has_ip_segment = True
-            if values["ipv6_properties"].address in {NewIPv6Address("::"), ""}:
-                raise IpEmpty(values["port_slot"], "IPv6")
-        if not has_ip_segment:
-            raise NoIpSegment(values["port_slot"])
+    def validate_ip(
+        cls, v: ProtocolSegmentProfileConfig, info: ValidationInfo
+    ) -> ProtocolSegmentProfileConfig:
+        # properties that failed their own validation are missing from info.data,
+        # pydantic already reports them so they are skipped here
+        ip_segment_type = v.ip_segment_type
+        if ip_segment_type is None:
+            raise NoIpSegment(info.data["port_slot"])
+        if ip_segment_type is ProtocolOption.IPV4:
+            ipv4_properties = info.data.get("ipv4_properties")
+            if ipv4_properties is not None and ipv4_properties.address in IPV4_EMPTY_VALUES:
+                raise IpEmpty(info.data["port_slot"], "IPv4")
+        else:
+            ipv6_properties = info.data.get("ipv6_properties")
+            if ipv6_properties is not None and ipv6_properties.address in IPV6_EMPTY_VALUES:
+                raise IpEmpty(info.data["port_slot"], "IPv6")
 
         return v
 
-    def change_ip_gateway_mac_address(self, gateway_mac: MacAddress):
-        self.ip_gateway_mac_address = gateway_mac
+    @classmethod
+    def construct_trusted(cls, **data: Any) -> "PortConfiguration":
+        """build from already validated field values (MacAddress, NewIPv4Address...)
+        without running the validators; external configs go through model_validate"""
+        return cls.model_construct(**data)
 
     @property
+    def gateway_mac_address(self) -> MacAddress:
+        """gateway mac resolved at runtime, falling back to the configured one"""
+        if self._resolved_gateway_mac_address is not None:
+            return self._resolved_gateway_mac_address
+        return self.ip_gateway_mac_address
+
+    def change_ip_gateway_mac_address(self, gateway_mac: MacAddress):
+        self._resolved_gateway_mac_address = gateway_mac
+
+    @cached_property
     def cap_port_rate(self) -> float:
         return self.port_rate_cap_unit.scale * self.port_rate_cap_value
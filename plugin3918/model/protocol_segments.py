@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import List, Optional, Annotated
 from pydantic import field_validator, BaseModel, NonNegativeInt, Field
 from xoa_driver.enums import ProtocolOption as XProtocolOption
@@ -948,22 +949,30 @@ class ProtocolSegmentProfileConfig(BaseModel):
     def header_segment_id_list(self) -> List[XProtocolOption]:
         return [h.type.xoa for h in self.header_segments]
 
+    @cached_property
+    def ip_segment_type(self) -> Optional[ProtocolOption]:
+        # the first IP segment decides the IP version of the profile
+        for header_segment in self.header_segments:
+            segment_type = header_segment.type
+            if segment_type is ProtocolOption.IPV4 or segment_type is ProtocolOption.IPV6:
+                return segment_type
+        return None
+
     @property
     def ip_version(self) -> IPVersion:
-        for header_segment in self.header_segments:
-            if ProtocolOption.IPV4 == header_segment.type:
-                return IPVersion.IPV4
-            elif ProtocolOption.IPV6 == header_segment.type:
-                return IPVersion.IPV6
+        ip_segment_type = self.ip_segment_type
+        if ip_segment_type is ProtocolOption.IPV4:
+            return IPVersion.IPV4
+        elif ip_segment_type is ProtocolOption.IPV6:
+            return IPVersion.IPV6
         raise NoIpSegment("No IP segment found")
 
     @property
     def segment_offset_for_ip(self) -> int:
         offset = 0
         for header_segment in self.header_segments:
-            if ProtocolOption.IPV4 == header_segment.type:
-                return offset
-            elif ProtocolOption.IPV6 == header_segment.type:
+            segment_type = header_segment.type
+            if segment_type is ProtocolOption.IPV4 or segment_type is ProtocolOption.IPV6:
                 return offset
             offset += len(header_segment.segment_value) // 2
         return -1
@@ -106,7 +106,7 @@ async def send_gateway_learning_request(
     if not ip_version:
         return address_refresh_map
 
-    gateway = port_instance.config.ip_gateway_mac_address
+    gateway = port_instance.config.gateway_mac_address
     gateway_not_empty = not gateway.is_empty
     if gateway_not_empty:
         address_refresh_map = add_address_refresh_entry(
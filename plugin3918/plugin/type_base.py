@@ -401,8 +401,8 @@ class BaseTestType:
             dmac = dest_instance.arp_mac_address
         elif is_in_same_subnet(src_instance.config, dest_instance.config, ip_version):
             dmac = dest_instance.native_mac_address
-        elif not src_instance.config.ip_gateway_mac_address.is_empty:
-            dmac = src_instance.config.ip_gateway_mac_address
+        elif not src_instance.config.gateway_mac_address.is_empty:
+            dmac = src_instance.config.gateway_mac_address
         else:
             raise UnableToObtainDmac(dest_instance.name)
         return dmac
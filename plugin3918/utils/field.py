@@ -83,8 +83,10 @@ class MacAddress(str):
 
 class NewIPv4Address(OldIPv4Address):
     @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls.validate, serialization=core_schema.to_string_ser_schema()
+        )
 
     @classmethod
     def validate(cls, value) -> "NewIPv4Address":
@@ -123,8 +125,10 @@ class NewIPv4Address(OldIPv4Address):
 
 class NewIPv6Address(OldIPv6Address):
     @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls.validate, serialization=core_schema.to_string_ser_schema()
+        )
 
     @classmethod
     def validate(cls, value) -> "NewIPv6Address":
@@ -157,6 +161,10 @@ class NewIPv6Address(OldIPv6Address):
 
 
 class Prefix(int):
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        return core_schema.no_info_after_validator_function(cls, handler(int))
+
     def to_ipv4(self) -> NewIPv4Address:
         return NewIPv4Address(int(self * "1" + (32 - self) * "0", 2))
 